@@ -138,11 +138,11 @@ def main():
 
             if model.training:
                 loss = F.nll_loss(output, target)
-                ppe.reporting.report({'train/loss': loss.item()})
+                ppe.reporting.report({'train/loss': loss})
                 return {'loss': loss}
 
             # Final result will be average of averages of the same size
-            test_loss = F.nll_loss(output, target, reduction='mean').item()
+            test_loss = F.nll_loss(output, target, reduction='mean')
             pred = output.argmax(dim=1, keepdim=True)
             return {'loss': test_loss, 'output': pred}
 
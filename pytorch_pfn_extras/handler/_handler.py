@@ -1,5 +1,5 @@
 from typing import (
-    Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional,
+    Any, Callable, Dict, Iterable, List, Mapping, Optional,
     Tuple, Union, TYPE_CHECKING,
 )
 
@@ -256,29 +256,36 @@ class Handler(BaseHandler):
 
         # This is used to send the batch to the appropiate device
         self._entry_runtime = entry_runtime
-        self._ppe_modules: List[ModulesTuple] = []
+        self._ppe_modules: Tuple[ModulesTuple, ...] = ()
 
     def consume_options(self, options: Dict[str, Any]) -> None:
         super().consume_options(options)
-        self._eval_report_keys = options.pop('eval_report_keys', [])
-        self._train_report_keys = options.pop('train_report_keys', [])
+        eval_report_keys = options.pop('eval_report_keys', [])
+        train_report_keys = options.pop('train_report_keys', [])
+        # Observation names are formatted once instead of on every step
+        self._eval_report_items: Tuple[Tuple[str, str], ...] = tuple(
+            (k, 'val/{}'.format(k)) for k in eval_report_keys)
+        self._train_report_items: Tuple[Tuple[str, str], ...] = tuple(
+            (k, 'train/{}'.format(k)) for k in train_report_keys)
         # Consume this argument for backward compatibility
         options.pop('async', False)
 
-    def _runtime_iterator(
+    def _iter_modules(
             self,
             models: Mapping[str, torch.nn.Module],
-    ) -> Generator[ModulesTuple, ModulesTuple, None]:
-        if not self._ppe_modules:
-            for n, m in models.items():
-                for sn, sm in ppe.runtime._runtime.named_runtime_modules(m, n):
-                    rt = ppe.runtime._runtime._module_runtime_tag(sm)
-                    assert rt is not None
-                    self._ppe_modules.append((sn, sm, rt))
-                    yield sn, sm, rt
-        else:
-            for sn, sm, rt in self._ppe_modules:
-                yield sn, sm, rt
+    ) -> Tuple[ModulesTuple, ...]:
+        # Called several times per iteration; the runtime modules are
+        # discovered once and the cached tuple is returned afterwards.
+        if self._ppe_modules:
+            return self._ppe_modules
+        modules: List[ModulesTuple] = []
+        for n, m in models.items():
+            for sn, sm in ppe.runtime._runtime.named_runtime_modules(m, n):
+                rt = ppe.runtime._runtime._module_runtime_tag(sm)
+                assert rt is not None
+                modules.append((sn, sm, rt))
+        self._ppe_modules = tuple(modules)
+        return self._ppe_modules
 
     def _setup(
             self,
@@ -292,19 +299,21 @@ class Handler(BaseHandler):
             # The default model always has empty name when obtained from the
             # modules
             loaders = {sn: loader
-                       for sn, _, _ in self._runtime_iterator(models)}
+                       for sn, _, _ in self._iter_modules(models)}
         else:
             loaders = loader
         if optimizers is None:
             optimizers = {}
+        # A single optimizer is shared by all the submodules
+        default_optim = (
+            next(iter(optimizers.values())) if len(optimizers) == 1
+            else None)
 
-        for sn, sm, rt in self._runtime_iterator(models):
+        for sn, sm, rt in self._iter_modules(models):
             # users can give a tensor or loader in case
             # shape cannot be inferred for submodules
             # TODO the optimizers are also needed?
-            optim = optimizers.get(sn, None)
-            if optim is None and len(optimizers) == 1:
-                optim = next(iter(optimizers.values()))
+            optim = optimizers.get(sn, default_optim)
             load = loaders.get(sn, None)
             rt.initialize_module(sm, load, optim)
 
@@ -330,7 +339,7 @@ class Handler(BaseHandler):
             trainer (Trainer): The trainer that calls this method.
             loader (torch.utils.data.DataLoader): The data loader.
         """
-        for _, sm, rt in self._runtime_iterator(trainer.models):
+        for _, sm, rt in self._iter_modules(trainer.models):
             rt.train_cleanup(sm)
 
     def train_epoch_begin(
@@ -344,7 +353,7 @@ class Handler(BaseHandler):
             trainer (Trainer): The trainer that calls this method.
             loader (torch.utils.data.DataLoader): The data loader.
         """
-        for _, sm, rt in self._runtime_iterator(trainer.models):
+        for _, sm, rt in self._iter_modules(trainer.models):
             rt.train_epoch_begin(sm)
 
         self._logic.train_epoch_begin(trainer.models, trainer.epoch, loader)
@@ -355,7 +364,7 @@ class Handler(BaseHandler):
         Args:
             trainer (Trainer): The trainer that calls this method.
         """
-        for _, sm, rt in self._runtime_iterator(trainer.models):
+        for _, sm, rt in self._iter_modules(trainer.models):
             rt.train_epoch_end(sm)
 
         self._logic.train_epoch_end(trainer.models, trainer.epoch)
@@ -371,7 +380,7 @@ class Handler(BaseHandler):
             evaluator (Evaluator): An evaluator.
         """
         # We need to correlate the models in trainer and evaluator
-        for _, sm, rt in self._runtime_iterator(evaluator.models):
+        for _, sm, rt in self._iter_modules(evaluator.models):
             rt.train_validation_begin(sm)
         self._logic.train_validation_begin(evaluator.models)
 
@@ -390,7 +399,7 @@ class Handler(BaseHandler):
         # Called after validation run, i.e. at the end of
         # every epoch in the training run.
         # We need to correlate the models in trainer and evaluator
-        for _, sm, rt in self._runtime_iterator(evaluator.models):
+        for _, sm, rt in self._iter_modules(evaluator.models):
             rt.train_validation_end(sm)
 
         self._logic.train_validation_end(evaluator.models)
@@ -412,7 +421,7 @@ class Handler(BaseHandler):
                 training step.
         """
         # Batch can be a dict or a tuple of dicts (1 per model in the logic)
-        for _, sm, rt in self._runtime_iterator(trainer.models):
+        for _, sm, rt in self._iter_modules(trainer.models):
             rt.train_pre_step(trainer, sm, batch_idx, batch)
 
         batch = self._entry_runtime.convert_batch(batch)
@@ -456,7 +465,7 @@ class Handler(BaseHandler):
             complete_fn (callable): A callback function called after
                 training step.
         """
-        for _, sm, rt in self._runtime_iterator(evaluator.models):
+        for _, sm, rt in self._iter_modules(evaluator.models):
             rt.eval_pre_step(evaluator, sm, batch_idx, batch)
 
         batch = self._entry_runtime.convert_batch(batch)
@@ -483,10 +492,11 @@ class Handler(BaseHandler):
         """
         # Context: Evaluator
         # Called after eval_step.
-        for _, sm, rt in self._runtime_iterator(evaluator.models):
+        for _, sm, rt in self._iter_modules(evaluator.models):
             rt.eval_post_step(evaluator, sm, batch_idx, batch, outputs)
-        for out in self._eval_report_keys:
-            reporting.report({"val/{}".format(out): outputs[out]})
+        if self._eval_report_items:
+            reporting.report(
+                {name: outputs[k] for k, name in self._eval_report_items})
 
     def eval_loop_end(self, evaluator: Evaluator) -> None:
         """A method called after running all steps of the evaluation.
@@ -513,7 +523,8 @@ class Handler(BaseHandler):
         """
         # Context: Trainer
         # Called after train_step.
-        for _, sm, rt in self._runtime_iterator(trainer.models):
+        for _, sm, rt in self._iter_modules(trainer.models):
             rt.train_post_step(trainer, sm, batch_idx, batch, outputs)
-        for out in self._train_report_keys:
-            reporting.report({"train/{}".format(out): outputs[out]})
+        if self._train_report_items:
+            reporting.report(
+                {name: outputs[k] for k, name in self._train_report_items})
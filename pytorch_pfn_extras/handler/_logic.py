@@ -16,9 +16,13 @@ except ImportError:
 
 
 @contextlib.contextmanager
-def torch_autocast(enabled: bool = True) -> Generator[None, None, None]:
+def torch_autocast(
+        enabled: bool = True,
+        **kwargs: Any,
+) -> Generator[None, None, None]:
     if _amp_enabled:
-        with torch.cuda.amp.autocast(enabled):  # type: ignore[no-untyped-call]
+        with torch.cuda.amp.autocast(  # type: ignore[no-untyped-call]
+                enabled, **kwargs):
             yield
     else:
         yield
@@ -177,8 +181,14 @@ class Logic(BaseLogic):
                 * ``'backward_outputs'`` (list of str):
                     A list of names of outputs that require compution of
                     the gradient.
-                * ``'autocast'`` (bool):
-                    If ``True``, ``torch.cuda.amp.autocast`` is enabled.
+                * ``'autocast'`` (bool or dict):
+                    If ``True``, ``torch.cuda.amp.autocast`` is enabled
+                    in both training and evaluation steps.
+                    A dict is passed to ``torch.cuda.amp.autocast`` as
+                    keyword arguments, e.g., ``{'dtype': torch.bfloat16}``
+                    to run in bfloat16, which needs no ``grad_scaler``;
+                    its ``'enabled'`` key defaults to ``True``.
+                    Passing a dict requires PyTorch 1.10 or later.
                     Default is ``False``.
                 * ``'grad_scaler'`` (torch.cuda.amp.GradScaler):
                     A gradient scaler that outputs are applied to.
@@ -191,7 +201,12 @@ class Logic(BaseLogic):
 
         self.backward_outputs = options.pop('backward_outputs', None)
         self._grad_scaler = options.pop('grad_scaler', None)
-        self._autocast = options.pop('autocast', False)
+        autocast = options.pop('autocast', False)
+        self._autocast_kwargs: Dict[str, Any] = {}
+        if isinstance(autocast, dict):
+            self._autocast_kwargs = dict(autocast)
+            autocast = self._autocast_kwargs.pop('enabled', True)
+        self._autocast = autocast
         self._backward_fn = options.pop('backward_function', None)
 
         if not _amp_enabled:
@@ -290,7 +305,8 @@ class Logic(BaseLogic):
             batch (torch.Tensor, list of torch.Tensor, dict of torch.Tensor):
                 Input tensors feeded to the model of the current step.
         """
-        with torch_autocast(enabled=self._autocast):
+        with torch_autocast(
+                enabled=self._autocast, **self._autocast_kwargs):
             optimizers[self.model_name].zero_grad()
             outs = self._forward(models[self.model_name], batch)
             to_back_outs = _normalize_outputs(outs)
@@ -354,7 +370,9 @@ class Logic(BaseLogic):
                 Input tensors feeded to the model of the current step.
         """
         model = models[self.model_name]
-        outs = self._forward(model, batch)
+        with torch_autocast(
+                enabled=self._autocast, **self._autocast_kwargs):
+            outs = self._forward(model, batch)
         return outs
 
 
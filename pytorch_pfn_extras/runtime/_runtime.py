@@ -21,9 +21,13 @@ except ImportError:
 
 
 @contextlib.contextmanager
-def _autocast(enabled: bool = True) -> Generator[None, None, None]:
+def _autocast(
+    enabled: bool = True, **kwargs: Any
+) -> Generator[None, None, None]:
     if _amp_enabled:
-        with torch.cuda.amp.autocast(enabled):  # type: ignore[no-untyped-call]
+        with torch.cuda.amp.autocast(  # type: ignore[no-untyped-call]
+            enabled, **kwargs
+        ):
             yield
     else:
         yield
@@ -300,8 +304,12 @@ class PyTorchRuntime(BaseRuntime):
         device_spec (torch.device or str): The device.
         options (dict, optional): The configuration options.
 
-            * ``'autocast'`` (bool):
+            * ``'autocast'`` (bool or dict):
                 If ``True``, ``torch.cuda.amp.autocast`` is enabled.
+                A dict is passed to ``torch.cuda.amp.autocast`` as
+                keyword arguments, e.g., ``{'dtype': torch.bfloat16}``;
+                its ``'enabled'`` key defaults to ``True``.
+                Passing a dict requires PyTorch 1.10 or later.
                 Default is ``False``.
             * ``'grad_scaler'`` (torch.cuda.amp.GradScaler):
                 A gradient scaler that outputs are applied to.
@@ -312,7 +320,12 @@ class PyTorchRuntime(BaseRuntime):
     ) -> None:
         super().__init__(device_spec, options)
         self._grad_scaler = options.get("grad_scaler", None)
-        self._autocast = options.get("autocast", False)
+        autocast = options.get("autocast", False)
+        self._autocast_kwargs: Dict[str, Any] = {}
+        if isinstance(autocast, dict):
+            self._autocast_kwargs = dict(autocast)
+            autocast = self._autocast_kwargs.pop("enabled", True)
+        self._autocast = autocast
         if not _amp_enabled:
             if self._grad_scaler is not None or self._autocast:
                 raise RuntimeError(
@@ -331,7 +344,9 @@ class PyTorchRuntime(BaseRuntime):
         return module.to(self.device_spec)
 
     def move_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
-        return tensor.to(self.device_spec)
+        # Copies from pinned memory can run asynchronously with the host;
+        # later kernels on the same stream are ordered after the copy.
+        return tensor.to(self.device_spec, non_blocking=tensor.is_pinned())
 
     def initialize_module(
         self,
@@ -410,7 +425,7 @@ class PyTorchRuntime(BaseRuntime):
             optimizer.zero_grad()
 
         # with autocast
-        with _autocast(enabled=self._autocast):
+        with _autocast(enabled=self._autocast, **self._autocast_kwargs):
             out = code_block.func(**batch)
 
         # codeblocks return Dicts-per-se so it is not necessary to normalize
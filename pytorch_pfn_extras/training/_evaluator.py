@@ -1,7 +1,7 @@
+import collections
 import contextlib
-import queue
 from typing import (
-    Any, Callable, Generator, Iterable, Mapping, Optional, Sequence,
+    Any, Callable, Deque, Generator, Iterable, Mapping, Optional, Sequence,
     Union, TYPE_CHECKING,
 )
 
@@ -83,7 +83,7 @@ class Evaluator:
     def _complete_step(
             self, idx: int, outs: DictBatch, *, is_deferred: bool = False
     ) -> None:
-        c_idx = self._idxs.get()
+        c_idx = self._idxs.popleft()
         # Asure that iterations complete in order
         if c_idx != idx:
             raise RuntimeError(
@@ -91,15 +91,15 @@ class Evaluator:
                 '{} was expected but completion of {} happened'.format(
                     c_idx, idx)
             )
-        x = self._inputs.get()
-        observed = self._observed.get()
+        x = self._inputs.popleft()
+        observed = self._observed.popleft()
         with self._reporter.scope(observed):
             outs = self._process_metrics(x, outs)
             self.handler.eval_post_step(self, idx, x, outs)
         self._summary.add(observed)
         self._update(idx)
         # On the last iteration, close the progress bar
-        if self._idxs.qsize() == 0:
+        if len(self._idxs) == 0:
             self._pbar.__exit__(None, None, None)
 
     def _gather_summaries(self) -> None:
@@ -120,9 +120,9 @@ class Evaluator:
                 The number of iterations per one evaluation epoch.
         """
         # Note: setup_manager is done by the Trainer.
-        self._idxs: 'queue.Queue[int]' = queue.Queue()
-        self._inputs: 'queue.Queue[DictBatch]' = queue.Queue()
-        self._observed: 'queue.Queue[Observation]' = queue.Queue()
+        self._idxs: 'Deque[int]' = collections.deque()
+        self._inputs: 'Deque[DictBatch]' = collections.deque()
+        self._observed: 'Deque[Observation]' = collections.deque()
 
         if eval_len is None:
             eval_len = len(loader)  # type: ignore[arg-type]
@@ -141,9 +141,9 @@ class Evaluator:
                         x = next(loader_iter)
                     except StopIteration:
                         break
-                    self._idxs.put(idx)
-                    self._inputs.put(x)
-                    self._observed.put(observation)
+                    self._idxs.append(idx)
+                    self._inputs.append(x)
+                    self._observed.append(observation)
                     with self._reporter.scope(observation):
                         self.handler.eval_step(
                             self, idx, x, self._complete_step)
@@ -178,6 +178,17 @@ class DistributedEvaluator(Evaluator):
 
     def _gather_summaries(self) -> None:
         world_size = torch.distributed.get_world_size()  # type: ignore[no-untyped-call]
+        # Tensors would be unpickled on the device of the sending rank, so
+        # only share Python scalars to be able to add the summaries up.
+        local_summary = reporting.DictSummary()
+        for name, summary in self._summary._summaries.items():
+            summary._add_deferred_values()
+            local = local_summary._summaries[name]
+            local._x = float(summary._x)
+            local._x2 = float(summary._x2)
+            local._n = summary._n
+            if isinstance(local._n, torch.Tensor):
+                local._n = local._n.item()
         summaries = [reporting.DictSummary() for _ in range(world_size)]
-        torch.distributed.all_gather_object(summaries, self._summary)  # type: ignore[no-untyped-call]
+        torch.distributed.all_gather_object(summaries, local_summary)  # type: ignore[no-untyped-call]
         self._summary = sum(summaries, reporting.DictSummary())
@@ -1,10 +1,11 @@
+import collections
 import collections.abc
 import contextlib
-import queue
 import time
 import warnings
 from typing import (
-    Any, Dict, Generator, Iterable, List, Mapping, Optional, Tuple, Union, TYPE_CHECKING
+    Any, Deque, Dict, Generator, Iterable, List, Mapping, Optional, Tuple, Union,
+    TYPE_CHECKING,
 )
 
 import torch
@@ -169,7 +170,7 @@ class Trainer:
             idx: int,
             outs: Any,
     ) -> None:
-        c_idx = self._idxs.get()
+        c_idx = self._idxs.popleft()
         # Asure that iterations complete in order
         if c_idx != idx:
             raise RuntimeError(
@@ -177,13 +178,13 @@ class Trainer:
                 '{} was expected but completion of {} happened'.format(
                     c_idx, idx)
             )
-        x = self._inputs.get()
-        begin = self._times.get()
+        x = self._inputs.popleft()
+        begin = self._times.popleft()
         (
             record_iteration,
             record_run_iteration,
             record_train_step,
-        ) = self._profile_records.get()
+        ) = self._profile_records.popleft()
         self.handler.train_post_step(self, idx, x, outs)
         reporting.report({"elapsed_time": time.time() - begin})
 
@@ -269,15 +270,15 @@ class Trainer:
 
                 # When iterations are completed in the callback
                 # This is needed to avoid being constantly passing parameters
-                self._idxs: 'queue.Queue[int]' = queue.Queue()
-                self._inputs: 'queue.Queue[Any]' = queue.Queue()
-                self._times: 'queue.Queue[float]' = queue.Queue()
-                self._observed: 'queue.Queue[reporting.Observation]' = queue.Queue()
+                self._idxs: 'Deque[int]' = collections.deque()
+                self._inputs: 'Deque[Any]' = collections.deque()
+                self._times: 'Deque[float]' = collections.deque()
+                self._observed: 'Deque[reporting.Observation]' = collections.deque()
                 # Iterator must be created after `train_epoch_begin` as it may be
                 #  using a DistributedSampler.
                 loader_iter = iter(train_loader)
-                self._profile_records: 'queue.Queue[List[_ReportNotification]]' \
-                    = queue.Queue()
+                self._profile_records: 'Deque[List[_ReportNotification]]' \
+                    = collections.deque()
                 for idx in range(train_len):
                     with record(
                         "pytorch_pfn_extras.training.Trainer:iteration",
@@ -298,22 +299,22 @@ class Trainer:
                             ):
                                 x = next(loader_iter)
                         begin = time.time()
-                        self._idxs.put(idx)
-                        self._inputs.put(x)
-                        self._times.put(begin)
+                        self._idxs.append(idx)
+                        self._inputs.append(x)
+                        self._times.append(begin)
                         with record(
                             "pytorch_pfn_extras.training.Trainer:run_iteration",
                             use_cuda=torch.cuda.is_available(),
                             enable=self._enable_profile
                         ) as ntf1, \
                                 self.manager.run_iteration():
-                            self._observed.put(self.manager.observation)
+                            self._observed.append(self.manager.observation)
                             with record(
                                 "pytorch_pfn_extras.training.Trainer:train_step",
                                 use_cuda=torch.cuda.is_available(),
                                 enable=self._enable_profile
                             ) as ntf2:
-                                self._profile_records.put([ntf0, ntf1, ntf2])
+                                self._profile_records.append([ntf0, ntf1, ntf2])
                                 self.handler.train_step(
                                     self, idx, x, complete_fn=self._complete_step)
                                 # Check if the callback was called
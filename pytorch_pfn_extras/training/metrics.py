@@ -10,6 +10,10 @@ MetricType = Callable[[Batch, Batch], Batch]
 class AccuracyMetric:
     """A metric for an evaluator to report accuracy.
 
+    .. note::
+       The reported ``accuracy`` is a 0-dim :class:`torch.Tensor` on the
+       device of the prediction, not a Python ``float``.
+
     Args:
         label_key: The key name of label.
         output_key: The key name of prediction.
@@ -24,13 +28,23 @@ class AccuracyMetric:
     def _preprocess_input(
             self, batch: Batch, out: Batch
     ) -> Tuple[torch.Tensor, int, torch.Tensor]:
-        labels = batch[self.label_key].cpu()
+        labels = batch[self.label_key]
         n_output = labels.shape[0]
-        pred = out[self.output_key][:n_output].cpu()
+        pred = out[self.output_key][:n_output]
+        # ``batch`` is the batch given by the loader, so the labels may still
+        # be on the host. Copy them to the device of the prediction so that
+        # the comparison runs there and no ``.item()`` is needed per step;
+        # the copy itself only overlaps with the host for pinned labels.
+        # Copies to the host must block, as the CPU would read them at once.
+        labels = labels.to(
+            pred.device, non_blocking=pred.device.type != 'cpu')
         return labels, n_output, pred
 
     def __call__(self, batch: Batch, out: Batch) -> Dict[str, Any]:
         with torch.no_grad():  # type: ignore[no-untyped-call]
             labels, n_output, pred = self._preprocess_input(batch, out)
-            correct = (labels.view_as(pred) == pred).sum().item()
-        return {"accuracy": correct / n_output}
+            # Count in int64 and divide the scalar only, rather than
+            # converting every element of the comparison to float
+            correct = torch.eq(labels.view_as(pred), pred).sum()
+            accuracy = correct / n_output
+        return {"accuracy": accuracy}
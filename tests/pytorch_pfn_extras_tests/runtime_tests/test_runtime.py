@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 import torch
 
@@ -43,6 +45,56 @@ class TestPytorchRuntime:
         tensor = rt.move_tensor(tensor)
         assert tensor.device.type == device
 
+    @pytest.mark.parametrize('device', ['cpu', 'cuda'])
+    @pytest.mark.parametrize('pinned', [True, False])
+    def test_move_tensor_non_blocking(self, device, pinned):
+        rt = ppe.runtime.PyTorchRuntime(device, {})
+        tensor = torch.arange(10)
+        if pinned:
+            tensor = tensor.pin_memory()
+        moved = rt.move_tensor(tensor)
+        assert moved.device.type == device
+        assert torch.equal(moved.cpu(), torch.arange(10))
+        # Only copies from pinned memory are asynchronous
+        with mock.patch.object(torch.Tensor, 'to') as to:
+            rt.move_tensor(tensor)
+        to.assert_called_once_with(rt.device_spec, non_blocking=pinned)
+
+
+@pytest.mark.gpu
+class TestPytorchRuntimeAutocast:
+    @pytest.mark.parametrize('autocast, dtype', [
+        ({'dtype': torch.bfloat16}, torch.bfloat16),
+        ({'enabled': False, 'dtype': torch.float16}, torch.float32),
+    ])
+    def test_autocast_dict(self, autocast, dtype):
+        if dtype == torch.bfloat16 and (
+                not ppe.requires('1.10.0')
+                or not torch.cuda.is_bf16_supported()):
+            pytest.skip('bfloat16 is not supported')
+
+        class _MModule(torch.nn.Module):
+            def forward(self, x, y):
+                return {'z': torch.mm(x, y)}
+
+        module = _MModule()
+        ppe.to(module, 'cuda', config={'autocast': autocast})
+        inputs = {
+            'x': torch.rand((2, 2)).cuda(),
+            'y': torch.rand((2, 2)).cuda(),
+        }
+        out = ppe.handler.forward(module)(inputs)
+        assert out['z'].dtype == dtype
+
+
+def test_autocast_dict_enabled_key():
+    options = {'autocast': {'enabled': False, 'dtype': torch.bfloat16}}
+    rt = ppe.runtime.PyTorchRuntime('cpu', options)
+    assert rt._autocast is False
+    assert rt._autocast_kwargs == {'dtype': torch.bfloat16}
+    # The given options are not modified
+    assert options['autocast']['enabled'] is False
+
 
 class DummyRuntime(ppe.runtime.BaseRuntime):
     def move_module(self, module):
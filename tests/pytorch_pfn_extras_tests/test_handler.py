@@ -213,6 +213,16 @@ class TestHandlerTrainSync(HandlerTester):
         assert reporter.observation['train/output'] == 1
         self._assert_called(module, to_move, 'train_post_step')
 
+    def test_train_post_step_multiple_keys(self):
+        options = {'train_report_keys': ['output', 'loss']}
+        handler, trainer, _ = self._get_handler(options)
+        self._move_modules(trainer.models['main'], ('self',))
+        reporter = ppe.reporting.Reporter()
+        with reporter:
+            handler.train_post_step(
+                trainer, 0, None, {'output': 1, 'loss': 2, 'other': 3})
+        assert reporter.observation == {'train/output': 1, 'train/loss': 2}
+
 
 class TestHandlerValidationSync(HandlerTester):
     def _get_handler(self, options=None):
@@ -269,43 +279,62 @@ class TestHandlerValidationSync(HandlerTester):
         assert reporter.observation['val/output'] == 1
         self._assert_called(module, to_move, 'eval_post_step')
 
+    def test_eval_post_step_multiple_keys(self):
+        options = {'eval_report_keys': ['output', 'loss']}
+        handler, evaluator, _ = self._get_handler(options)
+        self._move_modules(evaluator.models['main'], ('self',))
+        reporter = ppe.reporting.Reporter()
+        with reporter:
+            handler.eval_post_step(
+                evaluator, 0, None, {'output': 1, 'loss': 2, 'other': 3})
+        assert reporter.observation == {'val/output': 1, 'val/loss': 2}
+
 
 @pytest.mark.gpu
 class TestHandlerAutocast:
-    @pytest.mark.parametrize('autocast', [True, False])
-    def test_autocast(self, autocast):
-        trainer = MockTrainer()
+    @pytest.mark.parametrize('autocast, dtype', [
+        (True, torch.float16),
+        (False, torch.float32),
+        ({'dtype': torch.bfloat16}, torch.bfloat16),
+    ])
+    @pytest.mark.parametrize('step', ['train', 'eval'])
+    def test_autocast(self, autocast, dtype, step):
+        if dtype == torch.bfloat16 and (
+                not ppe.requires('1.10.0')
+                or not torch.cuda.is_bf16_supported()):
+            pytest.skip('bfloat16 is not supported')
         logic = ppe.handler.Logic(options={'autocast': autocast})
         handler = ppe.handler.Handler(
             logic, ppe.runtime.PyTorchRuntime('cuda', {}), {}
         )
 
-        completed = False
-
         class _MModule(torch.nn.Module):
             def forward(self, x, y):
                 return torch.mm(x, y)
 
-        trainer.models['main'] = _MModule()
-        trainer.optimizers['main'] = torch.optim.SGD(
-            [torch.nn.Parameter(torch.zeros(10))], 0.01
-        )
-        ppe.to(trainer.models['main'], 'cuda')
+        if step == 'train':
+            runner = MockTrainer()
+            runner.optimizers['main'] = torch.optim.SGD(
+                [torch.nn.Parameter(torch.zeros(10))], 0.01
+            )
+            run_step = handler.train_step
+        else:
+            runner = MockEvaluator()
+            run_step = handler.eval_step
+        runner.models['main'] = _MModule()
+        ppe.to(runner.models['main'], 'cuda')
         completed = False
 
         def callback(batch_idx, outs):
             nonlocal completed
-            if autocast:
-                assert outs.dtype == torch.float16
-            else:
-                assert outs.dtype == torch.float32
+            assert outs.dtype == dtype
             completed = True
 
         inputs = {
             'x': torch.rand((2, 2)).cuda(),
             'y': torch.rand((2, 2)).cuda(),
         }
-        handler.train_step(trainer, 0, inputs, callback)
+        run_step(runner, 0, inputs, callback)
         assert completed
 
     def test_autocast_not_enabled(self):
@@ -498,6 +527,12 @@ class TestLogic:
         finally:
             ppe.handler._logic._amp_enabled = old_enable
 
+    def test_autocast_dict_enabled_key(self):
+        options = {'autocast': {'enabled': False, 'dtype': torch.bfloat16}}
+        logic = ppe.handler.Logic(options=options)
+        assert logic._autocast is False
+        assert logic._autocast_kwargs == {'dtype': torch.bfloat16}
+
     def test_train_validation_begin(self):
         logic = ppe.handler.Logic()
         models = {'main': torch.nn.Linear(1, 1)}
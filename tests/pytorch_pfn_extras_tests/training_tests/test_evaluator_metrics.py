@@ -1,6 +1,9 @@
+from unittest import mock
+
 import pytest
 
 import torch
+import torch.distributed as dist
 
 import pytorch_pfn_extras as ppe
 from pytorch_pfn_extras import engine
@@ -37,3 +40,62 @@ def test_evaluator_with_metric(device, accuracy):
     with reporter.scope(observation):
         evaluator.run(data)
     assert pytest.approx(observation['val/accuracy']) == accuracy
+
+
+@pytest.mark.parametrize('label_device,pred_device', [
+    ('cpu', 'cpu'),
+    pytest.param('cpu', 'cuda', marks=pytest.mark.gpu),
+    pytest.param('cuda', 'cpu', marks=pytest.mark.gpu),
+    pytest.param('cuda', 'cuda', marks=pytest.mark.gpu),
+])
+def test_accuracy_metric_on_device(label_device, pred_device):
+    metric = ppe.training.metrics.AccuracyMetric('t', 'y')
+    batch = {'t': torch.tensor([0, 1, 2, 3], device=label_device)}
+    out = {'y': torch.tensor([0, 1, 0, 0], device=pred_device)}
+    accuracy = metric(batch, out)['accuracy']
+    assert isinstance(accuracy, torch.Tensor)
+    assert accuracy.device.type == pred_device
+    assert accuracy.item() == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize('device', [
+    'cpu',
+    pytest.param('cuda', marks=pytest.mark.gpu),
+])
+def test_distributed_evaluator_gathers_scalars(device):
+    model = MyModel(0.5)
+    ppe.to(model, device)
+    handler = engine.create_evaluator(model, device=device).handler
+    with mock.patch.object(dist, 'is_initialized', return_value=True):
+        evaluator = ppe.training.DistributedEvaluator(
+            handler, model,
+            metrics=[ppe.training.metrics.AccuracyMetric('t', 'y')])
+    evaluator._summary = ppe.reporting.DictSummary()
+    evaluator._summary.add(
+        {'accuracy': torch.tensor(0.5, device=device)})
+    # Weight sums that are not integers must be kept as they are
+    evaluator._summary.add({'loss': (1.0, 0.5)})
+    evaluator._summary.add(
+        {'loss': (torch.tensor(3.0, device=device),
+                  torch.tensor(0.25, device=device))})
+
+    sent = []
+
+    def all_gather_object(output, obj):
+        sent.append(obj)
+        # Another rank reporting a perfect accuracy
+        other = ppe.reporting.DictSummary()
+        other.add({'accuracy': 1.0, 'loss': (2.0, 0.25)})
+        output[:] = [obj, other]
+
+    with mock.patch.object(dist, 'get_world_size', return_value=2), \
+            mock.patch.object(dist, 'all_gather_object', all_gather_object):
+        evaluator._gather_summaries()
+
+    for summary in sent[0]._summaries.values():
+        assert not isinstance(summary._x, torch.Tensor)
+        assert not isinstance(summary._x2, torch.Tensor)
+        assert not isinstance(summary._n, torch.Tensor)
+    mean = evaluator._summary.compute_mean()
+    assert mean['accuracy'] == pytest.approx(0.75)
+    assert mean['loss'] == pytest.approx(1.75)